@@ -1,25 +1,34 @@
 import argparse
-import importlib
+import functools
 import json
 import os
 import sys
 from typing import Callable, Optional, Tuple
 
-import flask
-
-# Allow import from current working directory modules
-sys.path.append(os.getcwd())
-
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Constants
 CLI_VERSION = "0.0.1"
 
 HTTP_METHODS = ["GET", "POST", "PUT", "DELETE"]
 
+# frozenset for O(1) membership checks, the list stays for argparse choices= ordering
+_HTTP_METHODS_SET = frozenset(HTTP_METHODS)
+
 GCF_MODULE_PATH_ENV_VAR = "PD_FLASK_UTILS_GCF_PATH"
 
 DEFAULT_GCF_MAIN_PATH = "main.main"
 
+GCF_MAIN_IMPORT_PATH = os.environ.get(
+        GCF_MODULE_PATH_ENV_VAR, DEFAULT_GCF_MAIN_PATH
+    )
+
+# Split the import path once at module load, it is fixed for the process
+_GCF_MODULE_NAME, _, _GCF_MAIN_NAME = GCF_MAIN_IMPORT_PATH.rpartition(".")
+
 
 # Functions
 def load_json(json_payload: str) -> Optional[dict]:
@@ -35,11 +44,48 @@ def load_json(json_payload: str) -> Optional[dict]:
     if isinstance(json_payload, dict):
         return json_payload
 
-    if os.path.isfile(json_payload):
-        with open(json_payload, "r") as f:
-            return json.load(f)
-    else:
-        return json.loads(json_payload)
+    # Prefer orjson (C parser, noticeably faster on large payload files), fall back to stdlib json
+    loads = orjson.loads if orjson is not None else json.loads
+
+    # inline JSON objects/arrays/strings can't be file paths, sniffing the first
+    # char skips the stat() syscall for the common literal-payload case
+    stripped = json_payload.lstrip()
+    if stripped and stripped[0] in '{["':
+        return loads(json_payload)
+
+    try:
+        fd = os.open(json_payload, os.O_RDONLY)
+    except OSError:
+        # not a readable file, treat as a JSON literal (e.g. a bare number/bool)
+        return loads(json_payload)
+    # single fstat-sized os.read of the whole file; skips the BufferedReader
+    # layer that open().read()/json.load put between us and the bytes
+    try:
+        buf = os.read(fd, os.fstat(fd).st_size)
+    except OSError:
+        # non-regular files (e.g. a directory) open fine but fail to read,
+        # fall back to treating the input as a JSON literal like other open failures
+        return loads(json_payload)
+    finally:
+        os.close(fd)
+    return loads(buf)
+
+
+def _cached_import(module_name: str, attr_name: str):
+    """
+    Import a module and return one of its attributes.
+    Checks sys.modules first to skip importlib's finder walk and import lock when already loaded
+    :param module_name: import path of the module
+    :param attr_name: name of the attribute to fetch from the module
+    :return: the requested module attribute
+    """
+    if module_name not in sys.modules:
+        # importlib itself is imported lazily, it is only needed on the
+        # cold-import path
+        import importlib
+
+        importlib.import_module(module_name)
+    return getattr(sys.modules[module_name], attr_name)
 
 
 def import_main_gcf_entrypoint() -> Callable:
@@ -48,50 +94,48 @@ def import_main_gcf_entrypoint() -> Callable:
     Finds the import path based on an env variable "PD_FLASK_UTILS_GCF_PATH", defaults to "main.main"
     :return: a function acting as the main entrypoint for a python Cloud Function
     """
-    gcf_main_import_path = os.environ.get(
-        GCF_MODULE_PATH_ENV_VAR, DEFAULT_GCF_MAIN_PATH
-    )
-    gcf_main_import_path_list = gcf_main_import_path.split(".")
+    # Import main module with GCF entrypoint function
+    return _cached_import(_GCF_MODULE_NAME, _GCF_MAIN_NAME)
 
-    main_module_name = ".".join(gcf_main_import_path_list[0:-1])
-    gcf_main_name = gcf_main_import_path_list[-1]
 
-    # Import main module with GCF entrypoint function
-    main_gcf = importlib.import_module(main_module_name)
-    return getattr(main_gcf, gcf_main_name)
+_TEST_APP = None
 
 
 def mock_gcf_flask_request(
     gcf_main_func: Callable, http_method: str, endpoint: str, payload: Optional[dict]
-) -> Tuple[int, str]:
+) -> Tuple[int, bytes]:
     """
     Make a mock request to an entrypoint function of a HTTP Triggered Cloud Function via the flask test client
     :param gcf_main_func: a function acting as the main entrypoint for a python Cloud Function (HTTP Trigger)
     :param http_method: HTTP Method to use as uppercase string (eg. GET, POST, etc.)
     :param endpoint: endpoint of Flask App to call
     :param payload: Dict to include as json body
-    :return: Tuple of mock HTTP Response Status Code and Data
+    :return: Tuple of mock HTTP Response Status Code and Data (body as bytes)
     """
-    assert http_method in HTTP_METHODS
-
-    test_app = flask.Flask(__name__)
+    assert http_method in _HTTP_METHODS_SET
 
-    with test_app.test_request_context(endpoint, method=http_method, json=payload):
-        resp = gcf_main_func(flask.request)
+    # flask pulls in werkzeug/jinja2/etc, import lazily so --help/--version stay fast
+    import flask
 
-    return int(resp.status_code), resp.data.decode("utf-8")
+    # reuse one mock app across calls, Flask() re-registers config/converters every time
+    global _TEST_APP
+    if _TEST_APP is None:
+        _TEST_APP = flask.Flask(__name__)
 
+    with _TEST_APP.test_request_context(endpoint, method=http_method, json=payload):
+        resp = gcf_main_func(flask.request)
 
-def main():
+    # return the body as bytes, decoding here would just get re-encoded on output
+    return int(resp.status_code), resp.data
 
-    # Import main function entrypoint
-    try:
-        gcf_entrypoint: Callable = import_main_gcf_entrypoint()
-    except Exception as e:
-        gcf_import_error = e
-        gcf_entrypoint = None
 
-    # Setup CLI
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argparse parser for the CLI.
+    Cached so harnesses invoking main() repeatedly reuse the parser instead of rebuilding it
+    :return: configured ArgumentParser
+    """
     gcf_cli = argparse.ArgumentParser(
         description=f"""
         CLI wrapper around a Python function acting as the entrypoint to a Cloud Function (HTTP Trigger).
@@ -117,9 +161,24 @@ def main():
     )
     gcf_cli.version = CLI_VERSION
     gcf_cli.add_argument("--version", action="version")
+    return gcf_cli
+
 
-    # Parse inputs
+def main():
+
+    # Setup CLI
+    gcf_cli = _build_parser()
+
+    # Parse inputs; --help/--version exit here, before the entrypoint module
+    # (and flask with it) is ever imported
     args = gcf_cli.parse_args()
+
+    # Import main function entrypoint
+    try:
+        gcf_entrypoint: Callable = import_main_gcf_entrypoint()
+    except Exception as e:
+        gcf_import_error = e
+        gcf_entrypoint = None
     endpoint: str = args.endpoint
     http_method: str = args.http_method
     json_payload: str = args.json
@@ -151,18 +210,21 @@ def main():
     exit_value = 1
     print("\n", "-" * 100)
     if 200 <= status_code < 300:
-        print(
-            f"Finished successfully with mock status code {status_code}\n{resp_content}"
-        )
+        print(f"Finished successfully with mock status code {status_code}")
         exit_value = 0
     else:
-        print(
-            f"Endpoint command failed with mock status code {status_code}\n{resp_content}"
-        )
-        exit_value = resp_content
+        print(f"Endpoint command failed with mock status code {status_code}")
+        exit_value = resp_content.decode("utf-8", errors="replace")
+    # emit the body bytes directly, skipping a decode/encode round-trip through str
+    sys.stdout.flush()
+    sys.stdout.buffer.write(resp_content + b"\n")
 
     return sys.exit(exit_value)
 
 
 if __name__ == "__main__":
+    # Allow import from current working directory modules; done only when run as a
+    # script so merely importing this module doesn't mutate sys.path (which would
+    # invalidate importlib's path caches for every subsequent import)
+    sys.path.insert(0, os.getcwd())
     main()